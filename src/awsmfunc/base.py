@@ -1,4 +1,5 @@
 import math
+from dataclasses import replace
 from enum import Enum
 from functools import partial
 from os import PathLike
@@ -1106,8 +1107,8 @@ def DynamicTonemap(
             clip, format=vs.YUV444P16, chromaloc_in_s=chromaloc_in_s, chromaloc_s=chromaloc_in_s
         )
 
+        placebo_opts_final = replace(placebo_opts_final, dst_max=target_nits)
         pl_tm_params = placebo_opts_final.vsplacebo_dict()
-        pl_tm_params["dst_max"] = target_nits
 
         if placebo_opts_final.peak_detect:
             # Tonemap
@@ -1,5 +1,6 @@
+from dataclasses import asdict, dataclass, replace
 from enum import Enum, IntEnum
-from typing import Dict, NamedTuple, Optional
+from typing import Dict, Optional
 
 
 class PlaceboColorSpace(IntEnum):
@@ -107,7 +108,29 @@ class PlaceboHdrMetadataType(IntEnum):
     """Dynamic PQ luminance metadata, max_pq_y and avg_pq_y"""
 
 
-class PlaceboTonemapOpts(NamedTuple):
+# `vs-placebo` Tonemap argument names and the optional `PlaceboTonemapOpts` fields they're read from
+_VSPLACEBO_FIELD_MAP = (
+    ("src_csp", "source_colorspace"),
+    ("dst_csp", "target_colorspace"),
+    ("dst_prim", "target_primaries"),
+    ("gamut_mapping", "gamut_mapping"),
+    ("tone_mapping_function", "tone_map_function"),
+    ("tone_mapping_function_s", "tone_map_function_s"),
+    ("tone_mapping_param", "tone_map_param"),
+    ("use_dovi", "use_dovi"),
+    ("smoothing_period", "smoothing_period"),
+    ("scene_threshold_low", "scene_threshold_low"),
+    ("scene_threshold_high", "scene_threshold_high"),
+    ("show_clipping", "show_clipping"),
+    ("percentile", "percentile"),
+    ("metadata", "hdr_metadata_type"),
+    ("visualize_lut", "visualize_lut"),
+    ("contrast_recovery", "contrast_recovery"),
+)
+
+
+@dataclass(frozen=True)
+class PlaceboTonemapOpts:
     """Options for vs-placebo Tonemap. For use with awsmfunc.DynamicTonemap.
 
     Attributes:
@@ -135,8 +158,8 @@ class PlaceboTonemapOpts(NamedTuple):
 
     dst_max: float = 203.0
     """Target peak brightness, in nits"""
-    dst_min: float = dst_max / 1000
-    """Target black point, in nits"""
+    dst_min: Optional[float] = None
+    """Target black point, in nits. Defaults to `dst_max / 1000`"""
 
     peak_detect: bool = True
     """Use libplacebo's dynamic peak detection instead of FrameEval"""
@@ -145,7 +168,7 @@ class PlaceboTonemapOpts(NamedTuple):
     tone_map_function: Optional[PlaceboTonemapFunction] = None
     """Tone map function to use for luma"""
     tone_map_function_s: Optional[PlaceboTonemapFunctionName] = None
-    """Tone map function to use for luma, string name version"""
+    """Tone map function to use for luma, string name version. Mutually exclusive with `tone_map_function`"""
     tone_map_param: Optional[float] = None
     """Parameter for the tone map function"""
     contrast_recovery: Optional[float] = None
@@ -177,34 +200,36 @@ class PlaceboTonemapOpts(NamedTuple):
     use_planestats: bool = True
     """When peak detection is disabled, whether to use the frame max RGB for tone mapping"""
 
+    def __post_init__(self):
+        if self.tone_map_function is not None and self.tone_map_function_s is not None:
+            raise ValueError("Only one of `tone_map_function` and `tone_map_function_s` can be specified")
+
+    @property
+    def effective_dst_min(self) -> float:
+        """Target black point, in nits. Falls back to 1000:1 contrast when `dst_min` is unset"""
+        return self.dst_min if self.dst_min is not None else self.dst_max / 1000
+
+    def _replace(self, **changes) -> "PlaceboTonemapOpts":
+        """Compatibility with the previous `NamedTuple` API, prefer `dataclasses.replace`"""
+        return replace(self, **changes)
+
+    def _asdict(self) -> Dict:
+        """Compatibility with the previous `NamedTuple` API, prefer `dataclasses.asdict`"""
+        return asdict(self)
+
     def with_static_peak_detect(self):
         """Ignore peak detect smoothing and scene detection"""
-        return self._replace(smoothing_period=0, scene_threshold_low=0, scene_threshold_high=0)
+        return replace(self, smoothing_period=0, scene_threshold_low=0, scene_threshold_high=0)
 
     def vsplacebo_dict(self) -> Dict:
-        all_args = {
-            "src_csp": self.source_colorspace,
-            "dst_csp": self.target_colorspace,
-            "dst_prim": self.target_primaries,
-            "dst_max": self.dst_max,
-            "dst_min": self.dst_min,
-            "dynamic_peak_detection": self.peak_detect,
-            "gamut_mapping": self.gamut_mapping,
-            "tone_mapping_function": self.tone_map_function,
-            "tone_mapping_function_s": self.tone_map_function_s,
-            "tone_mapping_param": self.tone_map_param,
-            "use_dovi": self.use_dovi,
-            "smoothing_period": self.smoothing_period,
-            "scene_threshold_low": self.scene_threshold_low,
-            "scene_threshold_high": self.scene_threshold_high,
-            "show_clipping": self.show_clipping,
-            "percentile": self.percentile,
-            "metadata": self.hdr_metadata_type,
-            "visualize_lut": self.visualize_lut,
-            "contrast_recovery": self.contrast_recovery,
-        }
-
-        return {k: v for k, v in all_args.items() if v is not None}
+        out = {"dst_max": self.dst_max, "dst_min": self.effective_dst_min, "dynamic_peak_detection": self.peak_detect}
+
+        for key, attr in _VSPLACEBO_FIELD_MAP:
+            v = getattr(self, attr)
+            if v is not None:
+                out[key] = v.value if isinstance(v, Enum) else v
+
+        return out
 
     def is_dovi_src(self) -> bool:
         """Whether the options process the clip as Dolby Vision"""